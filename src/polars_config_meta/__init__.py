@@ -5,8 +5,13 @@ allowing users to attach, preserve, and transfer metadata across various DataFra
 operations.
 """
 
+import inspect
 import json
+import math
 import weakref
+from collections.abc import Callable, Sequence
+from functools import partial
+from types import MethodType
 from typing import Literal, overload
 
 import polars as pl
@@ -22,11 +27,31 @@ from .diagnostics import (
     print_discovered_methods,
     verify_patching,
 )
-from .discovery import discover_patchable_methods, patch_method, unpatch_all_methods
+from .discovery import (
+    _TRACKED_TYPES,
+    classify_return,
+    discover_patchable_methods,
+    patch_method,
+    unpatch_all_methods,
+)
+
+try:
+    import orjson
+
+    # Coerce non-str keys to str as the stdlib json module does, and hand datetimes
+    # and dataclasses (which orjson would otherwise encode) to `_reject_non_json`
+    _ORJSON_OPTS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
 
 __all__ = [
     "ConfigMetaOpts",
     "ConfigMetaPlugin",
+    "read_meta_only",
     "read_parquet_with_meta",
     "scan_parquet_with_meta",
     # Diagnostics
@@ -36,12 +61,96 @@ __all__ = [
     "verify_patching",
 ]
 
+# Attribute the plugin is registered under on DataFrame, LazyFrame and Series
+_NAMESPACE = "config_meta"
+
+# Exact-type check is a cheap fast path before falling back to isinstance (subclasses)
+_EXACT_TRACKED_TYPES = frozenset(_TRACKED_TYPES)
+
+# Parquet file metadata key the plugin metadata is stored under
+_PLUGIN_META_KEY = b"polars_plugin_meta"
+
+# Schema metadata written by Arrow/pandas that we don't carry over when writing:
+# the Parquet writer regenerates the Arrow schema itself.
+_SCHEMA_SIDECAR_KEYS = frozenset({b"ARROW:schema", b"pandas"})
+
+# Parquet writer defaults, following Polars' own `write_parquet` codec (rather than
+# PyArrow's snappy). Rows are converted to Arrow and written per row group.
+_DEFAULT_COMPRESSION = "zstd"
+_DEFAULT_COMPRESSION_LEVEL = 3
+_DEFAULT_ROW_GROUP_SIZE = 1024 * 1024
+
+
+def _has_non_finite(obj) -> bool:
+    """Whether `obj` holds a NaN or infinite float, which orjson writes as `null`."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _reject_non_json(obj):
+    """Refuse to encode what the stdlib encoder refuses (datetimes, dataclasses)."""
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _dumps_meta(metadata: dict) -> bytes:
+    """Serialize plugin metadata to JSON bytes, using orjson if available.
+
+    Falls back to the stdlib encoder wherever orjson's output would differ from it:
+    non-finite floats (orjson writes `null`, stdlib `NaN`/`Infinity`), integers
+    beyond 64 bits, and values the stdlib encoder rejects, which then raise.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(
+                metadata, default=_reject_non_json, option=_ORJSON_OPTS
+            )
+        except TypeError:
+            pass
+        else:
+            # Only look for non-finite floats if they may have been written as null
+            if b"null" not in encoded or not _has_non_finite(metadata):
+                return encoded
+    return json.dumps(metadata).encode("utf-8")
+
+
+def _loads_meta(raw: bytes) -> dict:
+    """Deserialize plugin metadata from JSON bytes, using orjson if available.
+
+    Falls back to the stdlib decoder for the `NaN`/`Infinity` tokens orjson rejects.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+_PQ = None
+
+
+def _get_pq():
+    """Import `pyarrow.parquet` on first use (PyArrow is an optional dependency)."""
+    global _PQ
+    if _PQ is None:
+        import pyarrow.parquet as pq
+
+        _PQ = pq
+    return _PQ
+
 
 # Configuration for automatic metadata preservation
 class ConfigMetaOpts:
     """Global configuration for the config_meta plugin."""
 
     auto_preserve_metadata = True
+    track_metadata = True
 
     @classmethod
     def enable_auto_preserve(cls):
@@ -55,6 +164,23 @@ class ConfigMetaOpts:
         cls.auto_preserve_metadata = False
         _unpatch_all()
 
+    @classmethod
+    def enable_tracking(cls):
+        """Enable metadata tracking (this is the default)."""
+        cls.track_metadata = True
+        _repatch_all()
+
+    @classmethod
+    def disable_tracking(cls):
+        """Disable metadata tracking, so that `.config_meta` only forwards method calls.
+
+        While disabled, objects are not registered for metadata, setting metadata is
+        a no-op and no metadata is propagated. Metadata already stored is kept, and
+        is available again once tracking is re-enabled.
+        """
+        cls.track_metadata = False
+        _unpatch_all()
+
 
 def _copy_metadata_to_result(source: pl.DataFrame | pl.LazyFrame | pl.Series, result):
     """Copy metadata from source to result.
@@ -62,42 +188,42 @@ def _copy_metadata_to_result(source: pl.DataFrame | pl.LazyFrame | pl.Series, re
     Ensures that metadata is transferred when a new DataFrame, LazyFrame, or Series
     is created from an existing one.
     """
-    if isinstance(result, (pl.DataFrame, pl.LazyFrame, pl.Series)):
-        source_id = id(source)
-        if source_id in ConfigMetaPlugin._df_id_to_meta:
+    if type(result) in _EXACT_TRACKED_TYPES or isinstance(result, _TRACKED_TYPES):
+        source_meta = ConfigMetaPlugin._df_id_to_meta.get(id(source))
+        # Nothing to copy (or register) if the source has no metadata
+        if source_meta:
             # Register the result and copy metadata
-            ConfigMetaPlugin(result)
-            ConfigMetaPlugin._df_id_to_meta[id(result)].update(
-                ConfigMetaPlugin._df_id_to_meta[source_id],
-            )
+            ConfigMetaPlugin(result)._get_meta().update(source_meta)
     return result
 
 
 _IS_PATCHED = False
 
+# Methods returning a tracked type, per tracked type (discovered once, on first use)
+_DISCOVERED_METHODS: dict[type, set[str]] = {}
+
+
+def _get_discovered_methods() -> dict[type, set[str]]:
+    """Discover the patchable methods of each tracked type, caching the result."""
+    if not _DISCOVERED_METHODS:
+        for cls in _TRACKED_TYPES:
+            _DISCOVERED_METHODS[cls] = discover_patchable_methods(cls)
+    return _DISCOVERED_METHODS
+
 
 def _ensure_patched():
     """Ensure all DataFrame, LazyFrame, and Series methods are patched."""
     global _IS_PATCHED
-    if not ConfigMetaOpts.auto_preserve_metadata:
+    if not (ConfigMetaOpts.auto_preserve_metadata and ConfigMetaOpts.track_metadata):
         return
 
     if _IS_PATCHED:
         return
 
-    # Discover and patch all methods that return DataFrame/LazyFrame/Series
-    dataframe_methods = discover_patchable_methods(pl.DataFrame)
-    lazyframe_methods = discover_patchable_methods(pl.LazyFrame)
-    series_methods = discover_patchable_methods(pl.Series)
-
-    for method_name in dataframe_methods:
-        patch_method(pl.DataFrame, method_name, _copy_metadata_to_result)
-
-    for method_name in lazyframe_methods:
-        patch_method(pl.LazyFrame, method_name, _copy_metadata_to_result)
-
-    for method_name in series_methods:
-        patch_method(pl.Series, method_name, _copy_metadata_to_result)
+    # Patch all methods that return DataFrame/LazyFrame/Series
+    for cls, method_names in _get_discovered_methods().items():
+        for method_name in method_names:
+            patch_method(cls, method_name, _copy_metadata_to_result)
 
     _IS_PATCHED = True
 
@@ -119,9 +245,81 @@ def _repatch_all():
     _ensure_patched()
 
 
-@register_dataframe_namespace("config_meta")
-@register_lazyframe_namespace("config_meta")
-@register_series_namespace("config_meta")
+def _make_forwarder(name: str) -> Callable:
+    """Build a plugin method that forwards `name` to the underlying object.
+
+    The returned function takes the plugin as its first argument, so a single
+    forwarder per method name can be bound to any plugin instance. Where the
+    method's return annotations show it always (or never) returns a tracked type,
+    the forwarder is specialised to skip checking the type of each result.
+    """
+    returns_tracked = _classify_forwarded_return(name)
+
+    if returns_tracked is False:
+
+        def forwarder(plugin: "ConfigMetaPlugin", *args, **kwargs):
+            return getattr(plugin._df, name)(*args, **kwargs)
+
+    elif returns_tracked:
+
+        def forwarder(plugin: "ConfigMetaPlugin", *args, **kwargs):
+            result = getattr(plugin._df, name)(*args, **kwargs)
+            source_meta = plugin._meta
+            if source_meta is None:
+                source_meta = plugin._get_meta()
+            if source_meta and ConfigMetaOpts.track_metadata:
+                ConfigMetaPlugin(result)._get_meta().update(source_meta)
+            return result
+
+    else:
+
+        def forwarder(plugin: "ConfigMetaPlugin", *args, **kwargs):
+            result = getattr(plugin._df, name)(*args, **kwargs)
+            # If the result is a new DataFrame/LazyFrame/Series, copy any metadata
+            source_meta = plugin._meta
+            if source_meta is None:
+                source_meta = plugin._get_meta()
+            if (
+                source_meta
+                and ConfigMetaOpts.track_metadata
+                and (
+                    type(result) in _EXACT_TRACKED_TYPES
+                    or isinstance(result, _TRACKED_TYPES)
+                )
+            ):
+                ConfigMetaPlugin(result)._get_meta().update(source_meta)
+            return result
+
+    forwarder.__name__ = forwarder.__qualname__ = name
+    return forwarder
+
+
+def _classify_forwarded_return(name: str) -> bool | None:
+    """Classify a method's return across every tracked type that defines it.
+
+    A forwarder is shared by every tracked type, so it may only be specialised if
+    all the types defining the method agree on what it returns.
+    """
+    kinds = {classify_return(cls, name) for cls in _TRACKED_TYPES if hasattr(cls, name)}
+    return kinds.pop() if len(kinds) == 1 else None
+
+
+def _is_method_on_all_tracked_types(name: str) -> bool:
+    """Check if `name` is a plain method on every type the plugin is registered on.
+
+    Only such methods can be installed on the plugin class itself: anything else
+    must keep going through `__getattr__` so that it raises (or returns a plain
+    attribute) appropriately for the type of the wrapped object.
+    """
+    return all(
+        inspect.isfunction(inspect.getattr_static(cls, name, None))
+        for cls in _TRACKED_TYPES
+    )
+
+
+@register_dataframe_namespace(_NAMESPACE)
+@register_lazyframe_namespace(_NAMESPACE)
+@register_series_namespace(_NAMESPACE)
 class ConfigMetaPlugin:
     """A plugin for managing DataFrame/LazyFrame/Series metadata.
 
@@ -132,39 +330,79 @@ class ConfigMetaPlugin:
     - Handle special cases like Parquet file writing
     """
 
+    # Instances are created for every newly accessed object: keep them small
+    __slots__ = ("_df", "_df_id", "_meta")
+
     # Global dictionaries to store metadata:
     _df_id_to_meta = {}
     _df_id_to_ref = {}
+    # Forwarding wrappers built by __getattr__, keyed by method name
+    _wrapper_cache: dict[str, Callable] = {}
+
+    def __new__(cls, obj: pl.DataFrame | pl.LazyFrame | pl.Series):
+        """Get the ConfigMetaPlugin for a specific DataFrame, LazyFrame, or Series.
 
-    def __init__(self, obj: pl.DataFrame | pl.LazyFrame | pl.Series):
-        """Initialize the ConfigMetaPlugin for a specific DataFrame, LazyFrame, or Series.
+        Polars caches the plugin on the object after its first `.config_meta` access,
+        so internal constructions for the same object (e.g. in `merge`) reuse that
+        instance rather than allocating and initializing a new one.
 
         Args:
             obj: The Polars DataFrame, LazyFrame, or Series to attach metadata to.
 
         """
+        cached = getattr(obj, "__dict__", {}).get(_NAMESPACE)
+        if type(cached) is cls:
+            return cached
+
+        self = super().__new__(cls)
         self._df = obj
         self._df_id = id(obj)
-        # If new to us, register a weakref so we can remove it on GC
-        if self._df_id not in self._df_id_to_meta:
-            self._df_id_to_meta[self._df_id] = {}
-            self._df_id_to_ref[self._df_id] = weakref.ref(obj, self._cleanup)
+        if not ConfigMetaOpts.track_metadata:
+            # Only forwarding calls: skip registering the object
+            self._meta = None
+            return self
+
+        self._meta = self._register()
 
         # Ensure methods are patched when plugin is first used (if enabled)
         if ConfigMetaOpts.auto_preserve_metadata:
             _ensure_patched()
 
+        return self
+
+    def _register(self) -> dict:
+        """Register the object, returning its (possibly pre-existing) metadata dict."""
+        meta = self._df_id_to_meta.get(self._df_id)
+        # If new to us, register a weakref so we can remove it on GC
+        if meta is None:
+            meta = self._df_id_to_meta[self._df_id] = {}
+            self._df_id_to_ref[self._df_id] = weakref.ref(
+                self._df, partial(self._cleanup, self._df_id)
+            )
+        return meta
+
+    def _get_meta(self) -> dict | None:
+        """Get the object's metadata dict, or None if metadata tracking is disabled.
+
+        Plugins created while tracking was disabled register their object on first
+        use here once it is re-enabled. Otherwise this is the dict bound at creation,
+        which methods hold directly so they don't re-index the global dict by id.
+        """
+        if not ConfigMetaOpts.track_metadata:
+            return None
+        if self._meta is None:
+            self._meta = self._register()
+        return self._meta
+
     @classmethod
-    def _cleanup(cls, obj_weakref):
-        """When the object is GC'd, remove references in the global dicts."""
-        to_remove = None
-        for obj_id, wref in cls._df_id_to_ref.items():
-            if wref is obj_weakref:
-                to_remove = obj_id
-                break
-        if to_remove is not None:
-            cls._df_id_to_ref.pop(to_remove, None)
-            cls._df_id_to_meta.pop(to_remove, None)
+    def _cleanup(cls, obj_id: int, obj_weakref: weakref.ref) -> None:
+        """When the object is GC'd, remove references in the global dicts.
+
+        The object's id is bound into the weakref callback at registration, so
+        cleanup is a constant-time pop rather than a scan over every tracked ref.
+        """
+        cls._df_id_to_ref.pop(obj_id, None)
+        cls._df_id_to_meta.pop(obj_id, None)
 
     def set(self, **kwargs) -> None:
         """Set metadata for the object.
@@ -173,7 +411,9 @@ class ConfigMetaPlugin:
             **kwargs: Key-value pairs to store as metadata.
 
         """
-        self._df_id_to_meta[self._df_id].update(kwargs)
+        meta = self._get_meta()
+        if meta is not None:
+            meta.update(kwargs)
 
     def update(self, mapping: dict) -> None:
         """Update existing metadata with new key-value pairs.
@@ -182,29 +422,35 @@ class ConfigMetaPlugin:
             mapping: A dictionary of metadata to update.
 
         """
-        self._df_id_to_meta[self._df_id].update(mapping)
+        meta = self._get_meta()
+        if meta is not None:
+            meta.update(mapping)
 
     def merge(self, *objs: pl.DataFrame | pl.LazyFrame | pl.Series) -> None:
         """Merge metadata from other DataFrames, LazyFrames, or Series by dict.update."""
+        meta = self._get_meta()
+        if meta is None:
+            return
         for other_obj in objs:
-            ConfigMetaPlugin(other_obj)  # ensure it's registered
-            other_id = id(other_obj)
-            self._df_id_to_meta[self._df_id].update(
-                self._df_id_to_meta.get(other_id, {}),
-            )
+            meta.update(ConfigMetaPlugin(other_obj)._get_meta())
 
     def get_metadata(self) -> dict:
         """Retrieve the current metadata for the object.
 
         Returns:
-            A dictionary containing the object's metadata.
+            A dictionary containing the object's metadata (always empty while metadata
+            tracking is disabled).
 
         """
-        return self._df_id_to_meta[self._df_id]
+        meta = self._get_meta()
+        return {} if meta is None else meta
 
     def clear_metadata(self) -> None:
         """Remove all metadata for this object."""
-        self._df_id_to_meta[self._df_id] = {}
+        # Clear in place: other plugin instances for this object share the dict
+        meta = self._get_meta()
+        if meta is not None:
+            meta.clear()
 
     def __getattr__(self, name: str):
         """Provide fallback for method calls not defined in the plugin.
@@ -235,51 +481,108 @@ class ConfigMetaPlugin:
             return obj_attr
 
         # If it's a method, wrap it so we can intercept the return value.
-        def wrapper(*args, **kwargs):
-            result = obj_attr(*args, **kwargs)
-            # If the result is a new DataFrame/LazyFrame/Series, copy the metadata
-            if isinstance(result, (pl.DataFrame, pl.LazyFrame, pl.Series)):
-                ConfigMetaPlugin(result)  # ensure plugin registration
-                self._df_id_to_meta[id(result)].update(self._df_id_to_meta[self._df_id])
-            return result
+        return MethodType(self._get_forwarder(name), self)
 
-        return wrapper
+    @classmethod
+    def _get_forwarder(cls, name: str) -> Callable:
+        """Get the forwarding wrapper for a method name, building it on first use.
+
+        Wrappers for methods available on every tracked type are also installed on
+        the class, so later lookups of that name never reach `__getattr__`.
+        """
+        forwarder = cls._wrapper_cache.get(name)
+        if forwarder is None:
+            forwarder = cls._wrapper_cache[name] = _make_forwarder(name)
+            if _is_method_on_all_tracked_types(name):
+                setattr(cls, name, forwarder)
+        return forwarder
 
     def _write_parquet_plugin(self, file_path: str, **kwargs):
         """Implement custom Parquet writing with metadata preservation.
 
         This method handles the Parquet writing process with the following steps:
         1) extracts plugin metadata
-        2) converts to Arrow
+        2) takes the Arrow schema from an empty slice of the data
         3) attaches the metadata to the Arrow schema
-        4) writes to Parquet with PyArrow
+        4) writes to Parquet with a PyArrow writer opened on that schema, converting
+           the data to Arrow one row group at a time so that a full Arrow copy of
+           the table is never held in memory
 
         Note: For Series, converts to single-column DataFrame first.
+
+        Keyword arguments are passed to `pyarrow.parquet.ParquetWriter`, defaulting to
+        zstd (level 3) compression and row groups of 1024 * 1024 rows. The Arrow
+        schema is stored in the footer by default, as Polars needs it to restore
+        dtypes such as Enum, Categorical and time zone-aware Datetime. Pass
+        `store_schema=False` to omit it and shrink the footer where that
+        doesn't matter.
         """
-        import pyarrow.parquet as pq
+        pq = _get_pq()
 
         # 1) get plugin metadata
-        metadata_dict = self._df_id_to_meta[self._df_id]
-        # convert to a JSON string for storage
-        metadata_json = json.dumps(metadata_dict).encode("utf-8")
+        metadata_dict = self._get_meta() or {}
+        # convert to JSON bytes for storage
+        metadata_json = _dumps_meta(metadata_dict)
 
-        # 2) convert to Arrow (handle Series by converting to DataFrame first)
+        # 2) get the Arrow schema (handle Series by converting to DataFrame first)
         if isinstance(self._df, pl.Series):
-            arrow_table = self._df.to_frame().to_arrow()
+            df = self._df.to_frame()
         elif isinstance(self._df, pl.LazyFrame):
-            arrow_table = self._df.collect().to_arrow()
+            df = self._df.collect()
         else:
-            arrow_table = self._df.to_arrow()
+            df = self._df
+        arrow_schema = df.clear().to_arrow().schema
 
         # 3) attach custom metadata
-        #    existing schema metadata + our custom "polars_plugin_meta"
-        existing_meta = arrow_table.schema.metadata or {}
-        new_meta = dict(existing_meta)  # copy
-        new_meta[b"polars_plugin_meta"] = metadata_json
-        arrow_table = arrow_table.replace_schema_metadata(new_meta)
+        #    existing schema metadata (minus Arrow/pandas schema sidecars, which
+        #    would only bloat the footer) + our custom "polars_plugin_meta"
+        existing_meta = arrow_schema.metadata
+        if existing_meta:
+            new_meta = {
+                **{
+                    key: value
+                    for key, value in existing_meta.items()
+                    if key not in _SCHEMA_SIDECAR_KEYS
+                },
+                _PLUGIN_META_KEY: metadata_json,
+            }
+        else:
+            # The usual case: Polars doesn't put any metadata on the Arrow schema
+            new_meta = {_PLUGIN_META_KEY: metadata_json}
+        # Only the schema carries the metadata: the data itself is left as-is
+        schema = arrow_schema.with_metadata(new_meta)
+
+        # 4) write to Parquet with PyArrow (as pq.write_table would, but the
+        #    writer takes the metadata from `schema` rather than the data)
+        row_group_size = kwargs.pop("row_group_size", None) or _DEFAULT_ROW_GROUP_SIZE
+        if "compression" not in kwargs:
+            # Only default the level along with the codec: not all codecs take one
+            kwargs["compression"] = _DEFAULT_COMPRESSION
+            kwargs.setdefault("compression_level", _DEFAULT_COMPRESSION_LEVEL)
+        with pq.ParquetWriter(file_path, schema, **kwargs) as writer:
+            for batch in df.iter_slices(n_rows=row_group_size):
+                writer.write_table(batch.to_arrow(), row_group_size=row_group_size)
+            if not kwargs.get("store_schema", True):
+                # Schema metadata is only written along with the Arrow schema, so
+                # put ours in the file's key-value metadata directly instead
+                writer.add_key_value_metadata(new_meta)
+
+
+def _prebuild_forwarders() -> None:
+    """Build forwarders up front for every method that returns a tracked type.
+
+    This moves the wrapper construction (and class installation) for the methods
+    most commonly chained through `.config_meta` to import time. The discovered
+    methods are cached, so patching on first use doesn't discover them again.
+    """
+    for method_names in _get_discovered_methods().values():
+        for method_name in method_names:
+            # Never shadow the plugin's own methods (e.g. Series.set, DataFrame.update)
+            if method_name not in vars(ConfigMetaPlugin):
+                ConfigMetaPlugin._get_forwarder(method_name)
 
-        # 4) write to Parquet with PyArrow
-        pq.write_table(arrow_table, file_path, **kwargs)
+
+_prebuild_forwarders()
 
 
 @overload
@@ -318,12 +621,8 @@ def _load_parquet_with_meta(
         A Polars DataFrame or LazyFrame with restored metadata.
 
     """
-    import pyarrow.parquet as pq
-
     # 1) read metadata with PyArrow
-    pyarrow_metadata = pq.read_schema(file_path).metadata
-    meta = pyarrow_metadata or {}
-    custom_json = meta.get(b"polars_plugin_meta", None)
+    data_dict = _read_plugin_meta(file_path)
 
     # 2) read Parquet with Polars
     if lazy:
@@ -331,29 +630,71 @@ def _load_parquet_with_meta(
     else:
         df = pl.read_parquet(file_path, **kwargs)
 
-    # 3) if custom metadata found, parse it + store in plugin
-    if custom_json is not None:
-        data_dict = json.loads(custom_json.decode("utf-8"))
-        ConfigMetaPlugin(df)  # ensure plugin registration
+    # 3) if custom metadata found, store in plugin
+    if data_dict is not None:
         df.config_meta.update(data_dict)
 
     return df
 
 
-def read_parquet_with_meta(file_path: str, **kwargs) -> pl.DataFrame:
+def _read_plugin_meta(file_path: str) -> dict | None:
+    """Read the plugin metadata stored in a Parquet file's footer.
+
+    Only the footer's key-value metadata is needed, so this skips rebuilding the
+    Arrow schema and memory-maps the file rather than reading it.
+
+    Returns:
+        The stored metadata, or None if the file has no plugin metadata.
+
+    """
+    pq = _get_pq()
+
+    pyarrow_metadata = pq.read_metadata(file_path, memory_map=True).metadata
+    meta = pyarrow_metadata or {}
+    custom_json = meta.get(_PLUGIN_META_KEY, None)
+    if custom_json is None:
+        return None
+    return _loads_meta(custom_json)
+
+
+def read_parquet_with_meta(
+    file_path: str,
+    columns: Sequence[int] | Sequence[str] | None = None,
+    filters: pl.Expr | Sequence[pl.Expr] | None = None,
+    **kwargs,
+) -> pl.DataFrame:
     """Read a Parquet file with its associated metadata.
 
     Loads the Parquet file and retrieves any stored plugin metadata.
 
+    When `filters` are given the file is scanned lazily and the filters applied
+    before collecting, so that Polars can push them down into the scan and skip
+    row groups whose statistics rule them out. The returned DataFrame is then the
+    filtered subset, with its metadata intact.
+
     Args:
         file_path: Path to the Parquet file to read.
-        **kwargs: Additional arguments to pass to the reading method.
+        columns: Names or indices of the columns to read (all columns if None).
+        filters: Polars expression(s) rows must satisfy to be read (all rows if None).
+        **kwargs: Additional arguments to pass to the reading method (the scanning
+            method, if `filters` are given).
 
     Returns:
         A Polars DataFrame with restored metadata.
 
     """
-    return _load_parquet_with_meta(file_path, lazy=False, **kwargs)
+    if filters is None:
+        return _load_parquet_with_meta(file_path, lazy=False, columns=columns, **kwargs)
+
+    lf = _load_parquet_with_meta(file_path, lazy=True, **kwargs)
+    # Go through config_meta so metadata is kept even without auto-preservation
+    lf = lf.config_meta.filter(filters)
+    if columns is not None:
+        # Bare ints would be selected as literals, so pick indexed columns with nth
+        if columns and all(isinstance(col, int) for col in columns):
+            columns = pl.nth(*columns)
+        lf = lf.config_meta.select(columns)
+    return lf.config_meta.collect()
 
 
 def scan_parquet_with_meta(file_path: str, **kwargs) -> pl.LazyFrame:
@@ -370,3 +711,20 @@ def scan_parquet_with_meta(file_path: str, **kwargs) -> pl.LazyFrame:
 
     """
     return _load_parquet_with_meta(file_path, lazy=True, **kwargs)
+
+
+def read_meta_only(file_path: str) -> dict:
+    """Read only the plugin metadata stored in a Parquet file.
+
+    Reads just the file footer without decoding any of the data, for when the
+    metadata is all that is needed.
+
+    Args:
+        file_path: Path to the Parquet file to read.
+
+    Returns:
+        The stored metadata dict (empty if the file has no plugin metadata).
+
+    """
+    data_dict = _read_plugin_meta(file_path)
+    return {} if data_dict is None else data_dict
@@ -18,6 +18,10 @@ _ORIGINAL_METHODS: dict[tuple[type, str], Any] = {}
 _TRACKED_TYPES = (pl.DataFrame, pl.LazyFrame, pl.Series)
 _TRACKED_TYPE_NAMES = {"DataFrame", "LazyFrame", "Series"}
 
+# Return annotations that pin down whether a result is a tracked type
+_ALWAYS_TRACKED_ANNOTATIONS = {"Self", *_TRACKED_TYPE_NAMES}
+_NEVER_TRACKED_ANNOTATIONS = {"None", "bool", "int", "float", "str", "bytes"}
+
 
 def discover_patchable_methods(cls: type) -> set[str]:
     """Discover all methods of a class that return any tracked type.
@@ -117,6 +121,42 @@ def _returns_tracked_type(method: Callable) -> bool:
         return False
 
 
+def classify_return(cls: type, method_name: str) -> bool | None:
+    """Classify whether a method's return value is always or never a tracked type.
+
+    Only exact return annotations are trusted (e.g. `-> Self` or `-> DataFrame`
+    always returns one, `-> int` never does); anything else, including unions,
+    type variables and missing annotations, could go either way.
+
+    Args:
+        cls: The class the method belongs to
+        method_name: Name of the method to classify
+
+    Returns:
+        True if the method always returns a tracked type, False if it never does,
+        or None if that can't be determined from its annotation
+
+    """
+    # Patched methods don't carry annotations: inspect the original instead
+    method = _ORIGINAL_METHODS.get((cls, method_name), getattr(cls, method_name, None))
+    if not inspect.isfunction(method):
+        return None
+
+    return_annotation = getattr(method, "__annotations__", {}).get("return")
+    if isinstance(return_annotation, type):
+        return_annotation = return_annotation.__name__
+    elif return_annotation is None and "return" in method.__annotations__:
+        return_annotation = "None"
+    if not isinstance(return_annotation, str):
+        return None
+
+    if return_annotation in _ALWAYS_TRACKED_ANNOTATIONS:
+        return True
+    if return_annotation in _NEVER_TRACKED_ANNOTATIONS:
+        return False
+    return None
+
+
 def patch_method(
     cls: type,
     method_name: str,
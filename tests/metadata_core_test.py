@@ -4,11 +4,26 @@ This module contains unit tests for the ConfigMetaPlugin, focusing on metadata
 preservation, copying, and special handling of DataFrame operations.
 """
 
+import gc
 import io
+import json
+import math
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
 
 import polars as pl
+import pytest
 
-from polars_config_meta import read_parquet_with_meta, scan_parquet_with_meta
+import polars_config_meta
+
+from polars_config_meta import (
+    ConfigMetaPlugin,
+    read_meta_only,
+    read_parquet_with_meta,
+    scan_parquet_with_meta,
+)
 
 
 def test_basic_metadata_storage():
@@ -42,6 +57,63 @@ def test_transform_copies_metadata():
     assert md3 == expected_meta, "Plain df.with_columns should also copy metadata"
 
 
+def test_forwarding_respects_wrapped_type():
+    """Test forwarded methods only resolve where the wrapped type has them."""
+    df = pl.DataFrame({"a": [1, 2]})
+    df.config_meta.set(owner="Alice")
+
+    # Forward once from a DataFrame so the wrappers are built and cached
+    assert df.config_meta.head(1).config_meta.get_metadata() == {"owner": "Alice"}
+    assert df.config_meta.get_column("a").config_meta.get_metadata() == {
+        "owner": "Alice",
+    }
+
+    s = pl.Series("a", [1, 2])
+    s.config_meta.set(owner="Bob")
+    assert s.config_meta.head(1).config_meta.get_metadata() == {"owner": "Bob"}
+    assert not hasattr(s.config_meta, "get_column"), "Series has no get_column"
+    assert not hasattr(pl.LazyFrame().config_meta, "get_column")
+
+
+def test_forwarders_prebuilt_at_import():
+    """Test forwarders for discovered methods exist before first use."""
+    assert "with_columns" in ConfigMetaPlugin._wrapper_cache
+    assert "collect" in ConfigMetaPlugin._wrapper_cache
+    # Available on every tracked type, so installed directly on the class
+    assert "head" in vars(ConfigMetaPlugin)
+    # Plugin methods are never replaced by forwarders
+    assert ConfigMetaPlugin.set.__qualname__ == "ConfigMetaPlugin.set"
+    assert ConfigMetaPlugin.update.__qualname__ == "ConfigMetaPlugin.update"
+
+
+def test_forwarding_by_return_type():
+    """Test forwarded methods handle tracked, untracked and mixed return types."""
+    df = pl.DataFrame({"a": [1, 2]})
+    df.config_meta.set(owner="Alice")
+    s = pl.Series("a", [1, 2])
+    s.config_meta.set(owner="Bob")
+
+    # Always a tracked type
+    assert df.config_meta.sort("a").config_meta.get_metadata() == {"owner": "Alice"}
+    # Never a tracked type
+    assert df.config_meta.is_empty() is False
+    # DataFrame.max returns a DataFrame but Series.max a scalar
+    assert df.config_meta.max().config_meta.get_metadata() == {"owner": "Alice"}
+    assert s.config_meta.max() == 2
+
+
+def test_empty_metadata_not_propagated():
+    """Test results of objects without metadata are not registered needlessly."""
+    df = pl.DataFrame({"a": [1, 2]})
+    assert df.config_meta.get_metadata() == {}
+
+    df2 = df.config_meta.head(1)
+    assert id(df2) not in ConfigMetaPlugin._df_id_to_meta
+    df3 = df.with_columns(b=pl.col("a") * 2)
+    assert id(df3) not in ConfigMetaPlugin._df_id_to_meta
+    assert df3.config_meta.get_metadata() == {}
+
+
 def test_merge_metadata():
     """Test merging metadata from multiple DataFrames."""
     df1 = pl.DataFrame({"a": [1]})
@@ -61,6 +133,43 @@ def test_merge_metadata():
     }, "Metadata merge did not behave as expected"
 
 
+def test_clear_metadata():
+    """Test clearing metadata is seen by every view onto the object's metadata."""
+    df = pl.DataFrame({"a": [1]})
+    df.config_meta.set(owner="Alice")
+    md = df.config_meta.get_metadata()
+
+    df.config_meta.clear_metadata()
+    assert df.config_meta.get_metadata() == {}, "Metadata not cleared"
+    assert md == {}, "Previously retrieved metadata dict went stale"
+
+    df.config_meta.set(owner="Bob")
+    assert df.select("a").config_meta.get_metadata() == {
+        "owner": "Bob",
+    }, "Metadata set after clearing not propagated"
+
+
+def test_plugin_reused_per_object():
+    """Test the plugin Polars caches on an object is reused for that object."""
+    df = pl.DataFrame({"a": [1]})
+    plugin = df.config_meta
+    assert ConfigMetaPlugin(df) is plugin, "Cached plugin not reused"
+    assert ConfigMetaPlugin(pl.DataFrame({"a": [1]})) is not plugin
+
+
+def test_metadata_cleaned_up_on_gc():
+    """Test that metadata is dropped once its object is garbage collected."""
+    df = pl.DataFrame({"a": [1]})
+    df.config_meta.set(owner="Alice")
+    df_id = id(df)
+    assert df_id in ConfigMetaPlugin._df_id_to_meta
+
+    del df
+    gc.collect()
+    assert df_id not in ConfigMetaPlugin._df_id_to_meta, "Metadata leaked after GC"
+    assert df_id not in ConfigMetaPlugin._df_id_to_ref, "Weakref leaked after GC"
+
+
 def test_parquet_roundtrip_in_memory():
     """Round trip some metadata through a Parquet file and back.
 
@@ -85,6 +194,188 @@ def test_parquet_roundtrip_in_memory():
     }, "Metadata lost or altered in roundtrip"
 
 
+def test_read_parquet_columns_and_filters():
+    """Test reading a subset of a Parquet file keeps its metadata."""
+    df = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    df.config_meta.set(author="Carol")
+
+    buffer = io.BytesIO()
+    df.config_meta.write_parquet(buffer)
+
+    buffer.seek(0)
+    df_cols = read_parquet_with_meta(buffer, columns=["col2"])
+    assert df_cols.columns == ["col2"], "Unexpected columns read"
+    assert df_cols.config_meta.get_metadata() == {"author": "Carol"}
+
+    buffer.seek(0)
+    df_rows = read_parquet_with_meta(
+        buffer, columns=["col2"], filters=pl.col("col1") > 1
+    )
+    assert df_rows["col2"].to_list() == ["b", "c"], "Filters not applied"
+    assert df_rows.config_meta.get_metadata() == {"author": "Carol"}
+
+    buffer.seek(0)
+    df_idx = read_parquet_with_meta(buffer, columns=[1], filters=pl.col("col1") > 1)
+    assert df_idx.columns == ["col2"], "Column indices not applied with filters"
+    assert df_idx["col2"].to_list() == ["b", "c"], "Filters not applied"
+    assert df_idx.config_meta.get_metadata() == {"author": "Carol"}
+
+
+def test_read_meta_only():
+    """Test reading just the metadata of a Parquet file, with and without any."""
+    df = pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+    df.config_meta.set(author="Carol", purpose="demo")
+
+    buffer = io.BytesIO()
+    df.config_meta.write_parquet(buffer)
+    buffer.seek(0)
+    assert read_meta_only(buffer) == {"author": "Carol", "purpose": "demo"}
+
+    plain = io.BytesIO()
+    pl.DataFrame({"col1": [1]}).write_parquet(plain)
+    plain.seek(0)
+    assert read_meta_only(plain) == {}, "Expected no metadata from plain Parquet"
+
+
+def test_parquet_roundtrip_multiple_row_groups():
+    """Test data and metadata survive being written one row group at a time."""
+    import pyarrow.parquet as pq
+
+    df = pl.DataFrame({"col1": range(5), "col2": list("abcde")})
+    df.config_meta.set(author="Carol")
+
+    buffer = io.BytesIO()
+    df.config_meta.write_parquet(buffer, row_group_size=2)
+    buffer.seek(0)
+    assert pq.read_metadata(buffer).num_row_groups == 3
+
+    buffer.seek(0)
+    df_in = read_parquet_with_meta(buffer)
+    assert df_in.equals(df), "Data changed on multi-row group roundtrip"
+    assert df_in.config_meta.get_metadata() == {"author": "Carol"}
+
+
+def test_parquet_write_compression():
+    """Test write_parquet compresses with zstd by default and accepts other codecs."""
+    import pyarrow.parquet as pq
+
+    df = pl.DataFrame({"col1": [1, 2]})
+    for kwargs, codec in [({}, "ZSTD"), ({"compression": "snappy"}, "SNAPPY")]:
+        buffer = io.BytesIO()
+        df.config_meta.write_parquet(buffer, **kwargs)
+        buffer.seek(0)
+        column = pq.read_metadata(buffer).row_group(0).column(0)
+        assert column.compression == codec, f"Unexpected codec for {kwargs}"
+
+
+def test_parquet_footer_metadata_is_text():
+    """Test the stored metadata is UTF-8 text, as Polars requires to read the file.
+
+    Parquet key-value metadata values are Thrift strings, and Polars' reader rejects
+    files where they aren't valid UTF-8, so binary encodings like msgpack can't be
+    stored there directly.
+    """
+    import pyarrow.parquet as pq
+
+    df = pl.DataFrame({"col1": [1, 2]})
+    df.config_meta.set(author="Carol", tags=["a", "b"], score=0.5)
+
+    buffer = io.BytesIO()
+    df.config_meta.write_parquet(buffer)
+    buffer.seek(0)
+    stored = pq.read_metadata(buffer).metadata[b"polars_plugin_meta"]
+    assert json.loads(stored.decode("utf-8")) == {
+        "author": "Carol",
+        "tags": ["a", "b"],
+        "score": 0.5,
+    }, "Stored metadata is not the expected JSON text"
+
+    buffer.seek(0)
+    assert pl.read_parquet(buffer).shape == (2, 1), "Polars failed to read the file"
+
+
+def _roundtrip_special_values(monkeypatch, write_with, read_with):
+    """Write then read floats/ints JSON encoders disagree on, with the given orjson."""
+    df = pl.DataFrame({"col1": [1, 2]})
+    df.config_meta.set(nan=float("nan"), inf=float("inf"), ninf=-math.inf, big=2**70)
+
+    buffer = io.BytesIO()
+    monkeypatch.setattr(polars_config_meta, "orjson", write_with)
+    df.config_meta.write_parquet(buffer)
+    buffer.seek(0)
+    monkeypatch.setattr(polars_config_meta, "orjson", read_with)
+    md_in = read_meta_only(buffer)
+
+    assert math.isnan(md_in["nan"]), "NaN not preserved"
+    assert md_in["inf"] == math.inf and md_in["ninf"] == -math.inf
+    assert md_in["big"] == 2**70, "Integer beyond 64 bits not preserved"
+
+
+def test_parquet_special_values_stdlib_json(monkeypatch):
+    """Test NaN, infinities and big integers round trip through the stdlib encoder."""
+    _roundtrip_special_values(monkeypatch, write_with=None, read_with=None)
+
+
+def test_parquet_special_values_orjson(monkeypatch):
+    """Test orjson reads and writes the same values as the stdlib encoder, both ways."""
+    orjson = pytest.importorskip("orjson")
+    for write_with, read_with in [(orjson, orjson), (None, orjson), (orjson, None)]:
+        _roundtrip_special_values(monkeypatch, write_with, read_with)
+
+
+def test_parquet_non_json_values(monkeypatch):
+    """Test values json rejects are rejected with orjson, bar UUIDs and enums."""
+    orjson = pytest.importorskip("orjson")
+
+    @dataclass
+    class Point:
+        x: int
+
+    class Colour(Enum):
+        RED = "red"
+
+    df = pl.DataFrame({"col1": [1, 2]})
+    for encoder in [None, orjson]:
+        monkeypatch.setattr(polars_config_meta, "orjson", encoder)
+        for value in [datetime(2020, 1, 1), date(2020, 1, 1), Point(1)]:
+            df.config_meta.set(value=value)
+            with pytest.raises(TypeError, match="not JSON serializable"):
+                df.config_meta.write_parquet(io.BytesIO())
+
+    # Only orjson encodes these (as their string and value respectively)
+    for value, stored in [
+        (uuid.UUID(int=1), str(uuid.UUID(int=1))),
+        (Colour.RED, "red"),
+    ]:
+        df.config_meta.set(value=value)
+        monkeypatch.setattr(polars_config_meta, "orjson", None)
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            df.config_meta.write_parquet(io.BytesIO())
+
+        monkeypatch.setattr(polars_config_meta, "orjson", orjson)
+        buffer = io.BytesIO()
+        df.config_meta.write_parquet(buffer)
+        buffer.seek(0)
+        assert read_meta_only(buffer) == {"value": stored}
+
+
+def test_parquet_footer_without_arrow_schema():
+    """Test that write_parquet kwargs reach the writer, e.g. dropping the Arrow schema."""
+    import pyarrow.parquet as pq
+
+    df = pl.DataFrame({"col1": [1, 2]})
+    df.config_meta.set(author="Carol")
+
+    buffer = io.BytesIO()
+    df.config_meta.write_parquet(buffer, store_schema=False)
+    buffer.seek(0)
+    assert set(pq.read_metadata(buffer).metadata) == {b"polars_plugin_meta"}
+
+    buffer.seek(0)
+    md_in = read_parquet_with_meta(buffer).config_meta.get_metadata()
+    assert md_in == {"author": "Carol"}, "Metadata lost without Arrow schema"
+
+
 def test_scan_parquet_with_metadata():
     """Test reading Parquet file with metadata using scan_parquet."""
     df = pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}).config_meta.lazy()
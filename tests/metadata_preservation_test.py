@@ -82,6 +82,36 @@ def test_re_enable_auto_preserve():
     }, "Should copy metadata after re-enabling"
 
 
+def test_disable_tracking():
+    """Test that disabling tracking turns config_meta into plain call forwarding."""
+    df = pl.DataFrame({"val": [10, 20]})
+    df.config_meta.set(source="generated")
+
+    ConfigMetaOpts.disable_tracking()
+    try:
+        df2 = pl.DataFrame({"val": [30, 40]})
+        df2.config_meta.set(source="ignored")
+        assert df2.config_meta.get_metadata() == {}, "set should be a no-op"
+
+        # Calls are still forwarded, but no metadata is propagated
+        df3 = df.config_meta.with_columns(doubled=pl.col("val") * 2)
+        assert df3.shape == (2, 2), "Call not forwarded when tracking disabled"
+        assert df3.config_meta.get_metadata() == {}
+        assert df.with_columns(pl.col("val") * 3).config_meta.get_metadata() == {}
+    finally:
+        ConfigMetaOpts.enable_tracking()
+
+    # Metadata stored before disabling is still there
+    assert df.config_meta.get_metadata() == {"source": "generated"}
+
+    # Objects first accessed while disabled are tracked once re-enabled
+    df2.config_meta.set(source="tracked")
+    assert df2.config_meta.get_metadata() == {"source": "tracked"}
+    assert df2.with_columns(pl.col("val") * 2).config_meta.get_metadata() == {
+        "source": "tracked",
+    }, "Plain df.with_columns should copy metadata after re-enabling"
+
+
 def test_dataframe_to_series_propagation():
     """Test that metadata propagates from DataFrame to Series via get_column."""
     df = pl.DataFrame({"foo": [1, 2, 3], "bar": [4, 5, 6]})